@@ -3,4 +3,12 @@
 from mangum import Mangum
 from titiler.main import app
 
-handler = Mangum(app, enable_lifespan=False)
+asgi_handler = Mangum(app, enable_lifespan=False)
+
+
+def handler(event, context):
+    """Skip scheduled warmer events, forward everything else to the ASGI app."""
+    if event.get("warmer"):
+        return {"warmer": True}
+
+    return asgi_handler(event, context)
@@ -80,9 +80,12 @@ class titilerStack(core.Stack):
             target_group=fargate_service.target_group,
         )
 
-        # scalable_target.scale_on_cpu_utilization(
-        #     "CpuScaling", target_utilization_percent=70,
-        # )
+        scalable_target.scale_on_cpu_utilization(
+            "CpuScaling",
+            target_utilization_percent=60,
+            scale_in_cooldown=core.Duration.seconds(240),
+            scale_out_cooldown=core.Duration.seconds(15),
+        )
 
         fargate_service.service.connections.allow_from_any_ipv4(
             port_range=ec2.Port(